@@ -3,6 +3,7 @@
 #
 # The following code is from https://stackoverflow.com/a/72366347/834250
 
+import os
 import pathlib
 
 import _pytest.pathlib
@@ -10,8 +11,10 @@ import _pytest.pathlib
 resolve_pkg_path_orig = _pytest.pathlib.resolve_package_path
 
 # we consider all dirs in repo/ to be namespace packages
+# os.scandir avoids a stat per entry, and the frozenset makes the
+# membership test in resolve_package_path O(1)
 root_dir = pathlib.Path(__file__).parent.resolve()
-namespace_pkg_dirs = [str(d) for d in root_dir.iterdir() if d.is_dir()]
+namespace_pkg_dirs = frozenset(entry.path for entry in os.scandir(root_dir) if entry.is_dir())
 
 
 # patched method
@@ -27,12 +27,14 @@
 
 import logging
 import os
+from collections.abc import Mapping
 from typing import Any, Literal, TypeVar, overload
 
 from lsst.ctrl.bps import BpsConfig
 
 __all__ = (
     "get_bps_config_value",
+    "get_bps_config_values",
     "get_workflow_name",
     "get_workflow_filename",
     "set_parsl_logging",
@@ -41,6 +43,10 @@ __all__ = (
 
 T = TypeVar("T")
 
+# Set CTRL_BPS_PARSL_NO_CONFIG_CACHE=1 to disable memoization of config
+# lookups, e.g., if the configuration is mutated between lookups.
+_NO_CACHE = bool(os.environ.get("CTRL_BPS_PARSL_NO_CONFIG_CACHE"))
+
 
 # Default provided, not required
 @overload
@@ -116,10 +122,40 @@ def get_bps_config_value(
     RuntimeError
         If the value is not set or is of the wrong type.
     """
+    # ``BpsConfig.search`` performs an expensive recursive traversal with
+    # environment expansion and variable replacement, and the same lookups are
+    # repeated for every job in a workflow. Memoize results on the config
+    # object itself so repeated lookups are cheap.
+    cache_key = None
+    if not _NO_CACHE and isinstance(default, (str, int, float, bool, type(None))):
+        cache = config.__dict__.setdefault("_parsl_search_cache", {})
+        cache_key = (key, default, required)
+        if cache_key in cache:
+            found, value = cache[cache_key]
+            return _check_config_value(key, dataType, default, required, found, value)
+
     options: dict[str, Any] = {"expandEnvVars": True, "replaceVars": True, "required": required}
     if default is not None:
         options["default"] = default
     found, value = config.search(key, options)
+    if cache_key is not None:
+        cache[cache_key] = (found, value)
+    return _check_config_value(key, dataType, default, required, found, value)
+
+
+def _check_config_value(
+    key: str,
+    dataType: type[T],
+    default: T | None,
+    required: bool,
+    found: bool,
+    value: Any,
+) -> T | None:
+    """Validate a value returned by `BpsConfig.search`.
+
+    This implements the type and presence checks for `get_bps_config_value`;
+    see that function for details of the parameters and exceptions.
+    """
     if not found and default is None:
         if required:
             raise KeyError(f"No value found for {key} and no default provided")
@@ -129,6 +165,38 @@ def get_bps_config_value(
     return value
 
 
+def get_bps_config_values(
+    config: BpsConfig,
+    spec: Mapping[str, tuple[type, Any]],
+    prefix: str = "",
+) -> dict[str, Any]:
+    """Get multiple values from the BPS configuration in one call.
+
+    This batches related lookups (e.g., the settings of one job slot) into a
+    single call, with each entry resolved as in `get_bps_config_value` and
+    therefore served from its cache where possible.
+
+    Parameters
+    ----------
+    config : `BpsConfig`
+        Configuration from which to retrieve values.
+    spec : `Mapping` [`str`, `tuple`]
+        Mapping from key name to a ``(dataType, default)`` pair.
+    prefix : `str`, optional
+        Prefix joined (with a dot) to every key before lookup, e.g.,
+        ``".small"`` to read keys of one job slot.
+
+    Returns
+    -------
+    values : `dict`
+        Resolved values, indexed by the (un-prefixed) keys of ``spec``.
+    """
+    return {
+        key: get_bps_config_value(config, f"{prefix}.{key}" if prefix else key, dataType, default)
+        for key, (dataType, default) in spec.items()
+    }
+
+
 def get_workflow_name(config: BpsConfig) -> str:
     """Get name of this workflow.
 
@@ -147,9 +215,11 @@ def get_workflow_name(config: BpsConfig) -> str:
         Workflow name.
     """
     project = get_bps_config_value(config, "project", str, "bps")
-    campaign = get_bps_config_value(
-        config, "campaign", str, get_bps_config_value(config, "operator", str, required=True)
-    )
+    # Only resolve the "operator" fallback if "campaign" isn't set; function
+    # argument defaults would be evaluated eagerly.
+    campaign = get_bps_config_value(config, "campaign", str)
+    if campaign is None:
+        campaign = get_bps_config_value(config, "operator", str, required=True)
     return f"{project}.{campaign}"
 
 
@@ -189,8 +259,9 @@ def set_parsl_logging(config: BpsConfig) -> int:
     if level_name not in ("CRITICAL", "DEBUG", "ERROR", "FATAL", "INFO", "WARN"):
         raise RuntimeError(f"Unrecognised parsl.log_level: {level_name}")
     level: int = getattr(logging, level_name)
-    for name in logging.root.manager.loggerDict:
-        if name.startswith("parsl"):
-            logging.getLogger(name).setLevel(level)
+    # Setting the level on the parent "parsl" logger propagates to all
+    # descendant loggers through the logging hierarchy, so there's no need
+    # to iterate over every known logger.
+    logging.getLogger("parsl").setLevel(level)
     logging.getLogger("database_manager").setLevel(logging.INFO)
     return level
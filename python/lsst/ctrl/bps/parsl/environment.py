@@ -29,12 +29,16 @@ import os
 
 __all__ = ("export_environment",)
 
+_SKIP_VARS = frozenset(("DISPLAY",))  # Variables not to export
+_SQ_ESC = "'\"'\"'"  # Escape sequence for a single quote inside single quotes
+_SQ_TABLE = str.maketrans({"'": _SQ_ESC})  # Translation table applying the escape
+
 
 def export_environment():
     """Generate bash script to regenerate the current environment."""
-    output = ""
+    parts: list[str] = []
     for key, val in os.environ.items():
-        if key in ("DISPLAY",):
+        if key in _SKIP_VARS:
             continue
         if val.startswith("() {"):
             # This is a function.
@@ -44,10 +48,12 @@ def export_environment():
             # From 2014-09-25, the function name is prefixed by 'BASH_FUNC_'
             # and suffixed by '()', which we have to remove.
             if key.startswith("BASH_FUNC_") and key.endswith("()"):
-                key = key[10:-2]
+                key = key.removeprefix("BASH_FUNC_").removesuffix("()")
 
-            output += f"{key} {val}\nexport -f {key}\n"
+            parts.append(f"{key} {val}\nexport -f {key}\n")
         else:
-            # This is a variable.
-            output += "export {key}='{val}'\n".format(key=key, val=val.replace("'", "'\"'\"'"))
-    return output
+            # This is a variable. Most values contain no single quotes, so
+            # check before paying for the translation.
+            escaped = val.translate(_SQ_TABLE) if "'" in val else val
+            parts.append(f"export {key}='{escaped}'\n")
+    return "".join(parts)
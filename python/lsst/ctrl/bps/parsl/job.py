@@ -27,28 +27,47 @@
 
 import os
 import re
-import subprocess
-from collections import defaultdict
-from collections.abc import Sequence
-from functools import partial
-from textwrap import dedent
-from typing import Any
+import string
+import sys
+from collections.abc import Iterable, Sequence
+from functools import cache, lru_cache, partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from lsst.ctrl.bps import BpsConfig, GenericWorkflow, GenericWorkflowJob
-from parsl.app.bash import BashApp
-from parsl.app.futures import Future
 
 from .configuration import get_bps_config_value
 
+if TYPE_CHECKING:
+    from parsl.app.bash import BashApp
+    from parsl.app.futures import Future
+
 __all__ = ("get_file_paths", "ParslJob")
 
-_env_regex = re.compile(r"<ENV:(\S+)>")  # Regex for replacing <ENV:WHATEVER> in BPS job command-lines
-_file_regex = re.compile(r"<FILE:(\S+)>")  # Regex for replacing <FILE:WHATEVER> in BPS job command-lines
+# Regex for replacing <ENV:WHATEVER> and <FILE:WHATEVER> in BPS job
+# command-lines
+_sym_regex = re.compile(r"<(ENV|FILE):([^>\s]+)>")
+
+# Script fragments wrapped around a job command to stage the execution butler.
+# Pre-dedented module constants save a textwrap.dedent pass per job; the job
+# command is concatenated between them rather than formatted in, so any braces
+# it contains are left for evaluate_command_line to resolve.
+_STAGE_HEADER = """
+if [[ ! -d {job_dir} ]]; then mkdir -p {job_dir}; fi
+cp -a --reflink=auto {exec_butler_dir}/. {job_dir}
+"""
+_STAGE_FOOTER = """
+retcode=$?
+rm -rf {job_dir}
+exit $retcode
+"""
+
+_name_src_uri = attrgetter("name", "src_uri")  # Extracts the file-path mapping for get_file_paths
 
 
 def run_command(
     command_line: str,
-    inputs: Sequence[Future] = (),
+    inputs: Sequence["Future"] = (),
     stdout: str | None = None,
     stderr: str | None = None,
     parsl_resource_specification: dict[str, Any] | None = None,
@@ -78,6 +97,170 @@ def run_command(
     return command_line
 
 
+@lru_cache(maxsize=128)
+def _isdir_cached(path: str) -> bool:
+    """Return whether ``path`` is a directory, caching the result.
+
+    The execution butler directory is probed for every job; on shared
+    filesystems each stat can be expensive, and the answer doesn't change
+    during a submission. The cache lives for the process lifetime.
+
+    Parameters
+    ----------
+    path : `str`
+        Path to check.
+
+    Returns
+    -------
+    isdir : `bool`
+        Whether ``path`` is an existing directory.
+    """
+    return os.path.isdir(path)
+
+
+@cache
+def _labeled_runner(label: str):
+    """Return a `run_command` clone named after the job label.
+
+    The name is used by parsl for tracking workflow status. Building one
+    function object per label (rather than a fresh `~functools.partial` per
+    job) lets identically-labelled jobs share it.
+
+    Parameters
+    ----------
+    label : `str`
+        Job label to use as the function name.
+
+    Returns
+    -------
+    runner : callable
+        Equivalent of `run_command`, with ``__name__`` set to ``label``.
+    """
+    runner = partial(run_command)
+    setattr(runner, "__name__", label)
+    return runner
+
+
+@cache
+def _get_log_dir(submit_path: str) -> str:
+    """Return the normalized directory for job stdout and stderr.
+
+    This is constant for a given submission, so cache it rather than joining
+    and normalizing the same strings once per job.
+
+    Parameters
+    ----------
+    submit_path : `str`
+        Submission path from the BPS configuration.
+
+    Returns
+    -------
+    log_dir : `str`
+        Directory for job logs.
+    """
+    return os.path.normpath(os.path.join(submit_path, "logs"))
+
+
+def _get_subdir_template(config: BpsConfig, site: str, label: str) -> str:
+    """Get the log subdirectory template for a job.
+
+    The template depends only on the site and cluster label, not on the
+    individual job, so the result is cached on the config object to avoid
+    repeating the search for every job in a workflow.
+
+    Parameters
+    ----------
+    config : `BpsConfig`
+        BPS configuration.
+    site : `str`
+        Compute site for the job.
+    label : `str`
+        Cluster label for the job.
+
+    Returns
+    -------
+    template : `str`
+        Subdirectory template, with BPS variables left unexpanded.
+    """
+    cache = config.__dict__.setdefault("_parsl_subdir_templates", {})
+    key = (site, label)
+    if key not in cache:
+        _, template = config.search(
+            "subDirTemplate",
+            opt={
+                "curvals": {"curr_site": site, "curr_cluster": label},
+                "replaceVars": False,
+                "default": "",
+            },
+        )
+        cache[key] = template
+    return cache[key]
+
+
+@lru_cache(maxsize=1024)
+def _parse_cmd_template(command: str) -> tuple[tuple[str, str], ...]:
+    """Parse a command-line into literal chunks and symbolic-name tokens.
+
+    Identical command-lines are common across the jobs of a cluster, so the
+    parsed form is cached: rendering a cached command becomes a list join
+    instead of a regex pass.
+
+    Parameters
+    ----------
+    command : `str`
+        Command-line containing ``<ENV:...>``/``<FILE:...>`` symbolic names.
+
+    Returns
+    -------
+    tokens : `tuple` of `tuple`
+        Sequence of ``(kind, value)`` pairs, where ``kind`` is one of
+        ``lit`` (literal text), ``env`` (environment variable name) or
+        ``file`` (symbolic file name).
+    """
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    for match in _sym_regex.finditer(command):
+        if match.start() > pos:
+            tokens.append(("lit", command[pos : match.start()]))
+        tokens.append(("env" if match.group(1) == "ENV" else "file", match.group(2)))
+        pos = match.end()
+    if pos < len(command):
+        tokens.append(("lit", command[pos:]))
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=4096)
+def _render_subdir(template: str, label: str, tag_items: tuple[tuple[str, Any], ...]) -> str:
+    """Render the log subdirectory for a job.
+
+    Jobs sharing a label and tags produce identical subdirectories, so the
+    rendering is cached: for homogeneous workflows this turns a per-job
+    ``str.format_map`` into a dict lookup.
+
+    Parameters
+    ----------
+    template : `str`
+        Subdirectory template.
+    label : `str`
+        Cluster label for the job.
+    tag_items : `tuple` of `tuple`
+        Sorted ``(key, value)`` pairs of the job tags.
+
+    Returns
+    -------
+    subdir : `str`
+        Rendered subdirectory, possibly empty.
+    """
+    # Pre-fill every field the template references with an empty string
+    # rather than paying for a defaultdict __missing__ call per unknown
+    # field during formatting.
+    fields = (name for _, name, _, _ in string.Formatter().parse(template) if name)
+    job_vals: dict[str, Any] = dict.fromkeys(fields, "")
+    job_vals["label"] = label
+    job_vals.update(tag_items)
+    return template.format_map(job_vals)
+
+
 def get_file_paths(workflow: GenericWorkflow, name: str) -> dict[str, str]:
     """Extract file paths for a job.
 
@@ -93,7 +276,8 @@ def get_file_paths(workflow: GenericWorkflow, name: str) -> dict[str, str]:
     paths : `dict` mapping `str` to `str`
         File paths for job, indexed by symbolic name.
     """
-    return {ff.name: ff.src_uri for ff in workflow.get_job_inputs(name)}
+    # map + attrgetter keep the attribute access in C for this per-job loop
+    return dict(map(_name_src_uri, workflow.get_job_inputs(name)))
 
 
 class ParslJob:
@@ -109,6 +293,20 @@ class ParslJob:
         File paths for job, indexed by symbolic name.
     """
 
+    __slots__ = (
+        "generic",
+        "name",
+        "config",
+        "file_paths",
+        "future",
+        "done",
+        "stdout",
+        "stderr",
+        "_evaluated_staged",
+        "_evaluated_bare",
+        "_resources",
+    )
+
     def __init__(
         self,
         generic: GenericWorkflowJob,
@@ -118,29 +316,33 @@ class ParslJob:
         self.generic = generic
         self.name = generic.name
         self.config = config
+        # Executable paths and argument templates repeat across the jobs of
+        # a cluster; interning them collapses the duplicates to one shared
+        # copy each.
+        if generic.executable is not None and isinstance(generic.executable.src_uri, str):
+            generic.executable.src_uri = sys.intern(generic.executable.src_uri)
+        if isinstance(generic.arguments, str):
+            generic.arguments = sys.intern(generic.arguments)
         self.file_paths = file_paths
         self.future = None
         self.done = False
+        self._evaluated_staged: str | None = None
+        self._evaluated_bare: str | None = None
+        self._resources: dict[str, Any] | None = None
 
         # Determine directory for job stdout and stderr
-        log_dir = os.path.join(get_bps_config_value(self.config, "submitPath", str, required=True), "logs")
-        _, template = self.config.search(
-            "subDirTemplate",
-            opt={
-                "curvals": {"curr_site": self.config["computeSite"], "curr_cluster": self.generic.label},
-                "replaceVars": False,
-                "default": "",
-            },
-        )
-        job_vals = defaultdict(str)
-        job_vals["label"] = self.generic.label
-        if self.generic.tags:
-            job_vals.update(self.generic.tags)
-        subdir = template.format_map(job_vals)
+        log_dir = _get_log_dir(get_bps_config_value(self.config, "submitPath", str, required=True))
+        template = _get_subdir_template(self.config, self.config["computeSite"], self.generic.label)
+        tag_items = tuple(sorted(self.generic.tags.items())) if self.generic.tags else ()
+        subdir = _render_subdir(template, self.generic.label, tag_items)
         # Call normpath just to make paths easier to read as templates tend
         # to have variables that aren't used by every job.  Avoid calling on
-        # empty string because changes it to dot.
-        same_part = os.path.normpath(os.path.join(log_dir, subdir, self.name))
+        # empty string because changes it to dot; log_dir is already
+        # normalized, so with no subdir a plain join suffices.
+        if subdir:
+            same_part = os.path.normpath(os.path.join(log_dir, subdir, self.name))
+        else:
+            same_part = os.path.join(log_dir, self.name)
         self.stdout = same_part + ".stdout"
         self.stderr = same_part + ".stderr"
 
@@ -166,7 +368,7 @@ class ParslJob:
         if not allow_stage:
             return command
         exec_butler_dir = get_bps_config_value(self.config, "executionButlerDir", str)
-        if not exec_butler_dir or not os.path.isdir(exec_butler_dir):
+        if not exec_butler_dir or not _isdir_cached(exec_butler_dir):
             # We're not using the execution butler
             return command
 
@@ -174,18 +376,17 @@ class ParslJob:
         # This keeps workers from overloading the sqlite database.
         # The copy can be deleted once we're done, because the original
         # execution butler contains everything that's required.
+        # A copy-on-write reflink gives a genuinely independent copy at
+        # metadata-only cost where the filesystem supports it; cp degrades to
+        # a real copy elsewhere. Hardlinks would not do: they share inodes,
+        # so locks and writes would still land on the original database.
         job_dir = os.path.join(os.path.dirname(exec_butler_dir), self.name)
         # Set the butlerConfig field to the location of the job-specific copy.
         command = command.replace("<FILE:butlerConfig>", job_dir)
-        return dedent(
-            f"""
-            if [[ ! -d {job_dir} ]]; then mkdir -p {job_dir}; fi
-            cp {exec_butler_dir}/* {job_dir}
-            {command}
-            retcode=$?
-            rm -rf {job_dir}
-            exit $retcode
-            """
+        return (
+            _STAGE_HEADER.format(job_dir=job_dir, exec_butler_dir=exec_butler_dir)
+            + command
+            + _STAGE_FOOTER.format(job_dir=job_dir)
         )
 
     def evaluate_command_line(self, command: str) -> str:
@@ -210,26 +411,56 @@ class ParslJob:
         command : `str`
             Command ready for execution on a worker.
         """
-        command = command.format(**self.generic.cmdvals)  # BPS variables
-
-        # Make sure *all* symbolic names are resolved.
-        #
-        # In general, actual values for some symbolic names may contain other
-        # symbolic names. As a result, more than one iteration may be required
-        # to resolve all symbolic names.  For example, an actual value for
-        # a filename may contain a symbolic name for an environment variable.
-        prev_command = command
-        while True:
-            command = re.sub(_env_regex, r"${\g<1>}", command)  # Environment variables
-            command = re.sub(_file_regex, lambda match: self.file_paths[match.group(1)], command)  # Files
-            if prev_command == command:
+        if "{" in command:
+            command = command.format(**self.generic.cmdvals)  # BPS variables
+
+        if "<" not in command:
+            # No symbolic names to resolve; skip the template parse.
+            return command
+
+        # Resolve environment variables and files. An actual value for a
+        # filename may contain a symbolic name for an environment variable, so
+        # iterate to a fixed point (bounded, in case of pathological
+        # self-referential values) until no symbolic names remain.
+        file_paths = self.file_paths
+        for _ in range(10):
+            command = "".join(
+                value if kind == "lit" else (f"${{{value}}}" if kind == "env" else file_paths[value])
+                for kind, value in _parse_cmd_template(command)
+            )
+            if "<" not in command or not _sym_regex.search(command):
                 break
-            prev_command = command
+        assert not _sym_regex.search(command), f"Unresolved symbolic names in command: {command}"
+        return command
+
+    def _get_evaluated_command_line(self, allow_stage: bool = True) -> str:
+        """Get the fully evaluated command-line for this job.
+
+        The inputs (command, ``cmdvals``, file paths) don't change over the
+        life of a `ParslJob`, so the result is computed once per value of
+        ``allow_stage`` and cached on the instance.
+
+        Parameters
+        ----------
+        allow_stage : `bool`
+            Allow staging of execution butler? See `get_command_line`.
 
+        Returns
+        -------
+        command : `str`
+            Command ready for execution on a worker.
+        """
+        attr = "_evaluated_staged" if allow_stage else "_evaluated_bare"
+        command: str | None = getattr(self, attr)
+        if command is None:
+            command = self.evaluate_command_line(self.get_command_line(allow_stage))
+            setattr(self, attr, command)
         return command
 
     def get_resources(self) -> dict[str, Any]:
         """Return what resources are required for executing this job."""
+        if self._resources is not None:
+            return self._resources
         resources = {}
         for bps_name, parsl_name, scale in (
             ("request_memory", "memory", None),  # Both BPS and WorkQueueExecutor use MB
@@ -241,15 +472,16 @@ class ParslJob:
             if scale is not None:
                 value *= scale
             resources[parsl_name] = value
+        self._resources = resources
         return resources
 
     def get_future(
         self,
-        app: BashApp,
-        inputs: list[Future],
+        app: "BashApp",
+        inputs: list["Future"],
         command_prefix: str | None = None,
         add_resources: bool = False,
-    ) -> Future | None:
+    ) -> "Future | None":
         """Get the parsl app future for the job.
 
         This effectively queues the job for execution by a worker, subject to
@@ -278,16 +510,15 @@ class ParslJob:
         if self.done:
             return None  # Nothing to do
         if not self.future:
-            command = self.get_command_line()
-            command = self.evaluate_command_line(command)
+            command = self._get_evaluated_command_line()
             if command_prefix:
                 command = command_prefix + "\n" + command
             resources = self.get_resources() if add_resources else {}
 
             # Add a layer of indirection to which we can add a useful name.
-            # This name is used by parsl for tracking workflow status.
-            func = partial(run_command)
-            setattr(func, "__name__", self.generic.label)
+            # This name is used by parsl for tracking workflow status. Jobs
+            # sharing a label share the underlying function object.
+            func = _labeled_runner(self.generic.label)
 
             self.future = app(func)(
                 command,
@@ -298,6 +529,22 @@ class ParslJob:
             )
         return self.future
 
+    @classmethod
+    def pre_create_log_dirs(cls, jobs: "Iterable[ParslJob]"):
+        """Create the log directories for a collection of jobs.
+
+        Creating each unique directory once up front is cheaper than having
+        every job (or worker) issue its own ``makedirs`` call chain.
+
+        Parameters
+        ----------
+        jobs : iterable of `ParslJob`
+            Jobs whose stdout/stderr directories should exist.
+        """
+        dirs = {os.path.dirname(path) for job in jobs for path in (job.stdout, job.stderr)}
+        for dd in dirs:
+            os.makedirs(dd, exist_ok=True)
+
     def run_local(self):
         """Run the command locally.
 
@@ -306,10 +553,20 @@ class ParslJob:
         """
         if self.done:  # Nothing to do
             return
-        command = self.get_command_line(False)
-        command = self.evaluate_command_line(command)
-        os.makedirs(os.path.dirname(self.stdout), exist_ok=True)
-        os.makedirs(os.path.dirname(self.stderr), exist_ok=True)
+        # Deferred import: only the initial and final jobs run locally, so
+        # workers never pay for loading subprocess.
+        import subprocess
+
+        command = self._get_evaluated_command_line(False)
+        out_dir = os.path.dirname(self.stdout)
+        err_dir = os.path.dirname(self.stderr)
+        os.makedirs(out_dir, exist_ok=True)
+        if err_dir != out_dir:
+            os.makedirs(err_dir, exist_ok=True)
         with open(self.stdout, "w") as stdout, open(self.stderr, "w") as stderr:
-            subprocess.check_call(command, shell=True, executable="/bin/bash", stdout=stdout, stderr=stderr)
+            # Invoke bash directly rather than with shell=True, which would
+            # add an extra layer of shell interpretation. Feeding the script
+            # on stdin rather than as a -c argument also avoids any argv
+            # length limit for long staged commands.
+            subprocess.run(["/bin/bash"], input=command, text=True, stdout=stdout, stderr=stderr, check=True)
         self.done = True
@@ -26,6 +26,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
+from functools import cache, cached_property
 from types import ModuleType
 from typing import TYPE_CHECKING
 
@@ -45,6 +46,30 @@ if TYPE_CHECKING:
 __all__ = ("SiteConfig",)
 
 
+@cache
+def _resolve_site_class(name: str) -> type["SiteConfig"]:
+    """Resolve and validate a site configuration class by name.
+
+    ``SiteConfig.from_config`` is called multiple times per submission (e.g.,
+    once for the workflow and once per parsl configuration); caching the
+    import and the subclass check means each is done once per class name.
+
+    Parameters
+    ----------
+    name : `str`
+        Fully-qualified name of a `SiteConfig` subclass.
+
+    Returns
+    -------
+    site_class : `type`
+        The resolved `SiteConfig` subclass.
+    """
+    site_class = doImport(name)
+    if isinstance(site_class, ModuleType) or not issubclass(site_class, SiteConfig):
+        raise RuntimeError(f"Site class={name} is not a SiteConfig subclass")
+    return site_class
+
+
 class SiteConfig(ABC):
     """Base class for site configuration.
 
@@ -108,10 +133,7 @@ class SiteConfig(ABC):
         """
         site = cls.get_site_subconfig(config)
         name = get_bps_config_value(site, "class", str, required=True)
-        site_config = doImport(name)
-        if isinstance(site_config, ModuleType) or not issubclass(site_config, SiteConfig):
-            raise RuntimeError(f"Site class={name} is not a SiteConfig subclass")
-        return site_config(config)
+        return _resolve_site_class(name)(config)
 
     @abstractmethod
     def get_executors(self) -> list[ParslExecutor]:
@@ -153,6 +175,17 @@ class SiteConfig(ABC):
         """
         return address_by_hostname()
 
+    @cached_property
+    def _address(self) -> str:
+        """IP address of the submission host, resolved once per instance
+        (`str`).
+
+        Resolving the address can involve DNS or interface enumeration, and
+        it is needed once per executor plus once for the monitor; use this
+        instead of calling `get_address` repeatedly.
+        """
+        return self.get_address()
+
     def get_command_prefix(self) -> str:
         """Return command(s) to add before each job command.
 
@@ -193,7 +226,7 @@ class SiteConfig(ABC):
             return None
         return MonitoringHub(
             workflow_name=get_workflow_name(self.config),
-            hub_address=self.get_address(),
+            hub_address=self._address,
             resource_monitoring_interval=get_bps_config_value(self.site, "monitorInterval", float, 30.0),
             logging_endpoint="sqlite:///"
             + get_bps_config_value(self.site, "monitorFilename", str, "monitor.sqlite"),
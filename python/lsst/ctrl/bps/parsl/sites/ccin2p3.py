@@ -1,21 +1,26 @@
-import copy
+import sys
+from bisect import bisect_left
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-import parsl.config
-from parsl.executors import HighThroughputExecutor
-from parsl.executors.base import ParslExecutor
-from parsl.providers import SlurmProvider
-
-from ..configuration import get_bps_config_value
+from ..configuration import get_bps_config_value, get_bps_config_values
 from ..site import SiteConfig
 
 if TYPE_CHECKING:
+    import parsl.config
+    from parsl.executors.base import ParslExecutor
+
     from .job import ParslJob
 
 __all__ = ("Ccin2p3",)
 
 Kwargs = dict[str, Any]
 
+# Multiplying by the reciprocal is cheaper than dividing in the per-job
+# executor-selection path.
+_MB_TO_GB = 1.0 / 1024.0
+
 
 class Ccin2p3(SiteConfig):
     """Configuration for executing Parsl jobs in CC-IN2P3 Slurm batch farm.
@@ -120,105 +125,124 @@ class Ccin2p3(SiteConfig):
     DEFAULT_PARTITION_LARGE: str = "lsst"
     DEFAULT_PARTITION_XLARGE: str = "lsst"
     DEFAULT_WALLTIME: str = "72:00:00"
-    DEFAULT_SCHEDULER_OPTIONS: list[str] = [
-        "--licenses=sps",
-    ]
+    # A tuple so the class-level default can't be mutated by accident;
+    # converted to a list where a list default is needed.
+    DEFAULT_SCHEDULER_OPTIONS: tuple[str, ...] = ("--licenses=sps",)
+
+    # Default memory (GB), maximum number of blocks and partition for each
+    # job slot size. Keeping the defaults in one table lets __init__ build
+    # the slots in a single loop instead of four hand-unrolled dict literals.
+    _SLOT_DEFAULTS: tuple[tuple[str, int, int, str], ...] = (
+        ("small", 4, 3_000, DEFAULT_PARTITION_SMALL),
+        ("medium", 10, 1_000, DEFAULT_PARTITION_MEDIUM),
+        ("large", 50, 100, DEFAULT_PARTITION_LARGE),
+        ("xlarge", 150, 10, DEFAULT_PARTITION_XLARGE),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._account = get_bps_config_value(self.site, ".account", str, self.DEFAULT_ACCOUNT)
         self._scheduler_options = get_bps_config_value(
-            self.site, ".scheduler_options", list, self.DEFAULT_SCHEDULER_OPTIONS
+            self.site, ".scheduler_options", list, list(self.DEFAULT_SCHEDULER_OPTIONS)
         )
-        self._slot_size = {
-            "small": {
-                "memory": get_bps_config_value(self.site, ".small.memory", int, 4),
-                "walltime": get_bps_config_value(self.site, ".small.walltime", str, self.DEFAULT_WALLTIME),
-                "max_blocks": get_bps_config_value(self.site, ".small.max_blocks", int, 3_000),
-                "partition": get_bps_config_value(
-                    self.site, ".small.partition", str, self.DEFAULT_PARTITION_SMALL
-                ),
-                "scheduler_options": get_bps_config_value(self.site, ".small.scheduler_options", list, []),
-            },
-            "medium": {
-                "memory": get_bps_config_value(self.site, ".medium.memory", int, 10),
-                "walltime": get_bps_config_value(self.site, ".medium.walltime", str, self.DEFAULT_WALLTIME),
-                "max_blocks": get_bps_config_value(self.site, ".medium.max_blocks", int, 1_000),
-                "partition": get_bps_config_value(
-                    self.site, ".medium.partition", str, self.DEFAULT_PARTITION_MEDIUM
-                ),
-                "scheduler_options": get_bps_config_value(self.site, ".medium.scheduler_options", list, []),
-            },
-            "large": {
-                "memory": get_bps_config_value(self.site, ".large.memory", int, 50),
-                "walltime": get_bps_config_value(self.site, ".large.walltime", str, self.DEFAULT_WALLTIME),
-                "max_blocks": get_bps_config_value(self.site, ".large.max_blocks", int, 100),
-                "partition": get_bps_config_value(
-                    self.site, ".large.partition", str, self.DEFAULT_PARTITION_LARGE
-                ),
-                "scheduler_options": get_bps_config_value(self.site, ".large.scheduler_options", list, []),
-            },
-            "xlarge": {
-                "memory": get_bps_config_value(self.site, ".xlarge.memory", int, 150),
-                "max_blocks": get_bps_config_value(self.site, ".xlarge.max_blocks", int, 10),
-                "walltime": get_bps_config_value(self.site, ".xlarge.walltime", str, self.DEFAULT_WALLTIME),
-                "partition": get_bps_config_value(
-                    self.site, ".xlarge.partition", str, self.DEFAULT_PARTITION_XLARGE
-                ),
-                "scheduler_options": get_bps_config_value(self.site, ".xlarge.scheduler_options", list, []),
-            },
+        # Site-level walltime and partition apply to every slot unless
+        # overridden at the slot level; resolve each of them once here
+        # instead of falling back per slot.
+        site_walltime = get_bps_config_value(self.site, ".walltime", str, self.DEFAULT_WALLTIME)
+        site_partition = get_bps_config_value(self.site, ".partition", str)
+        slot_size: dict[str, Kwargs] = {
+            name: get_bps_config_values(
+                self.site,
+                {
+                    "memory": (int, memory),
+                    "walltime": (str, site_walltime),
+                    "max_blocks": (int, max_blocks),
+                    "partition": (str, site_partition or partition),
+                    "scheduler_options": (list, []),
+                },
+                prefix=f".{name}",
+            )
+            for name, memory, max_blocks, partition in self._SLOT_DEFAULTS
         }
-
-    def get_executors(self) -> list[ParslExecutor]:
+        # Precompute the '#SBATCH' directive for each slot. Options specified
+        # at the slot level in the configuration file overwrite those
+        # specified at the site level.
+        for slot in slot_size.values():
+            options = slot["scheduler_options"] or self._scheduler_options
+            slot["sbatch_directive"] = f"#SBATCH {' '.join(options)}" if options else ""
+        # The slot table is read-only from here on; a mapping proxy makes
+        # that explicit and guards against accidental mutation.
+        self._slot_size: Mapping[str, Kwargs] = MappingProxyType(slot_size)
+        # Slot dispatch table for select_executor: memory limits (GB) with
+        # the interned label to return for each (and "xlarge" beyond the
+        # last). The per-slot limits are user-overridable, so sort the
+        # (limit, label) pairs together — bisect is only correct on an
+        # ascending sequence; the slot index breaks ties in favour of the
+        # first slot, matching a first-match scan.
+        slot_table = sorted(
+            (self._slot_size[name]["memory"], index, name)
+            for index, name in enumerate(("small", "medium", "large"))
+        )
+        self._memory_limits = tuple(limit for limit, _, _ in slot_table)
+        self._slot_labels = (*(sys.intern(name) for _, _, name in slot_table), sys.intern("xlarge"))
+        # Lazily-built caches: constructing executors and the parsl
+        # configuration is expensive, and the inputs are fixed at
+        # construction, so each is built at most once per instance.
+        self._executors: list[ParslExecutor] | None = None
+        self._parsl_config: parsl.config.Config | None = None
+
+    def get_executors(self) -> list["ParslExecutor"]:
         """Get a list of Parsl executors that can be used for processing a
         workflow.
 
         Each executor must have a unique ``label``.
         """
+        if self._executors is not None:
+            return self._executors
+        # Deferred imports: loading the parsl executor and provider modules
+        # is only needed when a parsl configuration is actually built.
+        from parsl.executors import HighThroughputExecutor
+        from parsl.providers import SlurmProvider
+
+        # Provider arguments common to every slot; the per-slot differences
+        # are applied on top of this base below.
+        base_slurm_kwargs: Kwargs = {
+            # Slurm account to which to charge resources used by the job.
+            "account": self._account,
+            # Nodes to provision per block (1 block = 1 CPU core).
+            "nodes_per_block": 1,
+            # Number of CPU cores to provision per node.
+            "cores_per_node": 1,
+            # Initial number of blocks.
+            "init_blocks": 0,
+            # Minimum number of blocks to maintain.
+            "min_blocks": 0,
+            # Set the number of file descriptors and processes to the
+            # maximum allowed.
+            "worker_init": "ulimit -n hard && ulimit -u hard",
+            # Requests nodes which are not shared with other running jobs.
+            "exclusive": False,
+            # Should files be moved by Parsl?
+            "move_files": False,
+        }
+
         executors: list[ParslExecutor] = []
         for label, slot in self._slot_size.items():
-            # Compute the scheduler options for this job slot. Options
-            # specified at the slot level in the configuration file
-            # overwrite those specified at the site level.
-            scheduler_options = copy.deepcopy(self._scheduler_options)
-            if slot_scheduler_options := slot.get("scheduler_options", []):
-                scheduler_options = copy.deepcopy(slot_scheduler_options)
-
-            options = f"#SBATCH {' '.join(opt for opt in scheduler_options)}" if scheduler_options else ""
-
             executor = HighThroughputExecutor(
                 label,
                 provider=SlurmProvider(
+                    **base_slurm_kwargs,
                     # Slurm partition to request blocks from.
                     partition=slot["partition"],
-                    # Slurm account to which to charge resources used by the
-                    # job.
-                    account=self._account,
-                    # Nodes to provision per block (1 block = 1 CPU core).
-                    nodes_per_block=1,
-                    # Number of CPU cores to provision per node.
-                    cores_per_node=1,
                     # Memory per node (GB) for each Slurm job.
                     mem_per_node=slot["memory"],
-                    # Initial number of blocks.
-                    init_blocks=0,
-                    # Minimum number of blocks to maintain.
-                    min_blocks=0,
                     # Maximum number of blocks to maintain.
                     max_blocks=slot["max_blocks"],
                     # Time limit for each Slurm job.
                     walltime=slot["walltime"],
                     # '#SBATCH' directives to prepend to the Slurm submission
-                    # script.
-                    scheduler_options=options,
-                    # Set the number of file descriptors and processes to
-                    # the maximum allowed.
-                    worker_init="ulimit -n hard && ulimit -u hard",
-                    # Requests nodes which are not shared with other running
-                    # jobs.
-                    exclusive=False,
-                    # Should files be moved by Parsl?
-                    move_files=False,
+                    # script, precomputed in __init__.
+                    scheduler_options=slot["sbatch_directive"],
                 ),
                 # Address to connect to the main Parsl process.
                 address=self.get_address(),
@@ -237,6 +261,7 @@ class Ccin2p3(SiteConfig):
             )
             executors.append(executor)
 
+        self._executors = executors
         return executors
 
     def select_executor(self, job: "ParslJob") -> str:
@@ -253,15 +278,12 @@ class Ccin2p3(SiteConfig):
             Label of executor to use to execute ``job``.
         """
         # We choose the executor to use based only on the memory required
-        # by the job.
-        memory = job.generic.request_memory / 1024  # Convert to GB
-        for label in ("small", "medium", "large"):
-            if memory <= self._slot_size[label]["memory"]:
-                return label
-
-        return "xlarge"
+        # by the job. bisect_left finds the smallest slot whose memory limit
+        # accommodates the request without a Python-level scan.
+        memory = job.generic.request_memory * _MB_TO_GB  # Convert to GB
+        return self._slot_labels[bisect_left(self._memory_limits, memory)]
 
-    def get_parsl_config(self) -> parsl.config.Config:
+    def get_parsl_config(self) -> "parsl.config.Config":
         """Get Parsl configuration for using CC-IN2P3 Slurm farm as a
         Parsl execution site.
 
@@ -270,6 +292,11 @@ class Ccin2p3(SiteConfig):
         config : `parsl.config.Config`
             The configuration to be used to initialize Parsl for this site.
         """
+        if self._parsl_config is not None:
+            return self._parsl_config
+
+        import parsl.config
+
         executors = self.get_executors()
         monitor = self.get_monitor()
 
@@ -283,7 +310,7 @@ class Ccin2p3(SiteConfig):
         # Use a strategy that allows for scaling up and down Parsl workers.
         strategy = get_bps_config_value(self.site, ".strategy", str, "htex_auto_scale")
 
-        return parsl.config.Config(
+        self._parsl_config = parsl.config.Config(
             executors=executors,
             monitoring=monitor,
             retries=retries,
@@ -291,3 +318,4 @@ class Ccin2p3(SiteConfig):
             run_dir=run_dir,
             strategy=strategy,
         )
+        return self._parsl_config
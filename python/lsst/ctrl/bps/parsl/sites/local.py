@@ -51,9 +51,18 @@ class Local(SiteConfig):
         """Get a list of executors to be used in processing.
 
         Each executor should have a unique ``label``.
+
+        The executor list is built once per instance and cached: repeated
+        calls return the same objects rather than constructing fresh ones.
         """
-        cores = get_bps_config_value(self.site, "cores", int, required=True)
-        return [HighThroughputExecutor("local", provider=LocalProvider(), max_workers_per_node=cores)]
+        executors: list[ParslExecutor] | None = getattr(self, "_executors", None)
+        if executors is None:
+            cores = get_bps_config_value(self.site, "cores", int, required=True)
+            executors = [
+                HighThroughputExecutor("local", provider=LocalProvider(), max_workers_per_node=cores)
+            ]
+            self._executors = executors
+        return executors
 
     def select_executor(self, job: "ParslJob") -> str:
         """Get the ``label`` of the executor to use to execute a job.
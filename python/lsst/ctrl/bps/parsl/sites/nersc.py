@@ -30,12 +30,23 @@ from typing import Any
 from parsl.executors.base import ParslExecutor
 from parsl.launchers import SrunLauncher
 
+from ..configuration import get_bps_config_value
 from .slurm import TripleSlurm
 
 Kwargs = dict[str, Any]
 
 __all__ = ("CoriKnl",)
 
+# '#SBATCH' directives common to every executor; constant, so joined once at
+# import rather than on each get_executors call.
+_SCHEDULER_OPTIONS = "\n".join(
+    (
+        "#SBATCH --module=cvmfs",
+        "#SBATCH --licenses=cvmfs",
+        "#SBATCH --time-min=2:00:00",
+    )
+)
+
 
 class CoriKnl(TripleSlurm):
     """Configuration for running jobs on the NERSC Cori-KNL cluster.
@@ -62,6 +73,10 @@ class CoriKnl(TripleSlurm):
     - ``small_walltime`` (`str`): time limit for each 'small' Slurm job.
     - ``medium_walltime`` (`str`): time limit for each 'small' Slurm job.
     - ``large_walltime`` (`str`): time limit for each 'large' Slurm job.
+    - ``heartbeat_period`` (`int`): period (seconds) of worker heartbeats.
+    - ``heartbeat_threshold`` (`int`): time (seconds) without a heartbeat
+      after which a worker is declared dead and its tasks reassigned; keep
+      this at least three times the period.
     """
 
     def get_executors(
@@ -87,13 +102,6 @@ class CoriKnl(TripleSlurm):
         **common_options : Any
             Common options for ``make_executor`` for each of the executors.
         """
-        scheduler_options = "\n".join(
-            (
-                "#SBATCH --module=cvmfs",
-                "#SBATCH --licenses=cvmfs",
-                "#SBATCH --time-min=2:00:00",
-            )
-        )
         provider_options = {
             "exclusive": True,
             "init_blocks": 0,
@@ -103,12 +111,18 @@ class CoriKnl(TripleSlurm):
             "launcher": SrunLauncher(overrides="-K0 -k --slurmd-debug=verbose"),
             "cmd_timeout": 300,
         }
-        executor_options = {"worker_debug": False, "heartbeat_period": 60, "heartbeat_threshold": 180}
+        # A tighter heartbeat reclaims tasks stuck on dead nodes sooner, at
+        # the cost of more frequent traffic; make the knobs configurable.
+        executor_options = {
+            "worker_debug": False,
+            "heartbeat_period": get_bps_config_value(self.site, "heartbeat_period", int, 60),
+            "heartbeat_threshold": get_bps_config_value(self.site, "heartbeat_threshold", int, 180),
+        }
 
         return super().get_executors(
             nodes=1,
             constraint="knl",
-            scheduler_options=scheduler_options,
+            scheduler_options=_SCHEDULER_OPTIONS,
             provider_options=provider_options,
             executor_options=executor_options,
             **common_options,
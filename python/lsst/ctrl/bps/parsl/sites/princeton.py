@@ -56,6 +56,10 @@ class Tiger(Slurm):
     - ``cmd_timeout`` (`int`): timeout (seconds) to wait for a scheduler.
     - ``singleton`` (`bool`): allow only one job to run at a time; by default
       ``True``.
+    - ``heartbeat_period`` (`int`): period (seconds) of worker heartbeats.
+    - ``heartbeat_threshold`` (`int`): time (seconds) without a heartbeat
+      after which a worker is declared dead; keep this at least three times
+      the period.
 
     When running on the Tiger cluster, you should operate on the
     ``/scratch/gpfs`` filesystem, rather than ``/projects`` or ``/tigress``,
@@ -90,6 +94,13 @@ class Tiger(Slurm):
         """
         max_blocks = get_bps_config_value(self.site, "max_blocks", int, 2)
         cmd_timeout = get_bps_config_value(self.site, "cmd_timeout", int, 300)
+        # Optional worker-heartbeat tuning, passed through when configured;
+        # parsl's own defaults apply otherwise.
+        executor_options = {
+            key: value
+            for key in ("heartbeat_period", "heartbeat_threshold")
+            if (value := get_bps_config_value(self.site, key, int)) is not None
+        }
         return [
             self.make_executor(
                 "tiger",
@@ -107,6 +118,7 @@ class Tiger(Slurm):
                     "launcher": SrunLauncher(overrides="-K0 -k"),
                     "cmd_timeout": cmd_timeout,
                 },
+                executor_options=executor_options,
             )
         ]
 
@@ -138,8 +150,19 @@ class Tiger(Slurm):
         This implementation gets the address from the Infiniband network
         interface, because the cluster nodes can't connect to the head node
         through the regular internet.
+
+        The address is resolved once per instance: enumerating the network
+        interfaces costs a kernel round-trip, and parsl asks for the address
+        repeatedly (executors and monitor).
         """
-        net_interfaces = [interface for interface in net_if_addrs().keys() if interface[:2] in ["ib", "op"]]
-        if net_interfaces:
-            return address_by_interface(net_interfaces[0])
-        raise RuntimeError("No Infiniband network interface found.")
+        # N.B. the cache must not be named "_address": that is the base-class
+        # cached_property, which calls this method, and reading it from here
+        # before it has been populated would recurse without limit.
+        address: str | None = getattr(self, "_interface_address", None)
+        if address is None:
+            interface = next((name for name in net_if_addrs() if name[:2] in ("ib", "op")), None)
+            if interface is None:
+                raise RuntimeError("No Infiniband network interface found.")
+            address = address_by_interface(interface)
+            self._interface_address = address
+        return address
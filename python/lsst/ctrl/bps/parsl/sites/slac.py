@@ -54,6 +54,10 @@ class Sdf(Slurm):
     - ``max_blocks`` (`int`): maximum number of blocks (Slurm jobs) to use.
     - ``singleton`` (`bool`): allow only one job to run at a time; by default
       ``True``.
+    - ``heartbeat_period`` (`int`): period (seconds) of worker heartbeats.
+    - ``heartbeat_threshold`` (`int`): time (seconds) without a heartbeat
+      after which a worker is declared dead; keep this at least three times
+      the period.
     """
 
     def get_executors(self) -> list[ParslExecutor]:
@@ -66,6 +70,13 @@ class Sdf(Slurm):
         allow us to run almost continually until the workflow is done.
         """
         max_blocks = get_bps_config_value(self.site, "max_blocks", int, 2)
+        # Optional worker-heartbeat tuning, passed through when configured;
+        # parsl's own defaults apply otherwise.
+        executor_options = {
+            key: value
+            for key in ("heartbeat_period", "heartbeat_threshold")
+            if (value := get_bps_config_value(self.site, key, int)) is not None
+        }
         return [
             self.make_executor(
                 "sdf",
@@ -84,6 +95,7 @@ class Sdf(Slurm):
                     "worker_init": export_environment(),
                     "launcher": SrunLauncher(overrides="-K0 -k --slurmd-debug=verbose"),
                 },
+                executor_options=executor_options,
             )
         ]
 
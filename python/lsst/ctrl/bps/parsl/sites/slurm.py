@@ -25,6 +25,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from bisect import bisect_left
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from parsl.executors import HighThroughputExecutor
@@ -42,6 +44,10 @@ __all__ = ("Slurm", "TripleSlurm")
 
 Kwargs = dict[str, Any]
 
+# Multiplying by the reciprocal is cheaper than dividing in the per-job
+# executor-selection path.
+_MB_TO_GB = 1.0 / 1024.0
+
 
 class Slurm(SiteConfig):
     """Configuration for generic Slurm cluster.
@@ -77,8 +83,17 @@ class Slurm(SiteConfig):
       ``False``.
     - ``scheduler_options`` (`str`): text to prepend to the Slurm submission
       script (each line usually starting with ``#SBATCH``).
+    - ``prefetch_capacity`` (`int`): number of tasks each worker pool fetches
+      ahead of free capacity; raising this amortizes submission round-trips
+      for workflows with many short jobs. By default we use whatever parsl
+      gives us.
     """
 
+    @cached_property
+    def _job_name(self) -> str:
+        """Name shared by every Slurm job of this workflow (`str`)."""
+        return get_workflow_name(self.config)
+
     def make_executor(
         self,
         label: str,
@@ -136,26 +151,39 @@ class Slurm(SiteConfig):
         qos = get_bps_config_value(self.site, "qos", str, qos)
         singleton = get_bps_config_value(self.site, "singleton", bool, singleton)
         scheduler_options = get_bps_config_value(self.site, "scheduler_options", str, scheduler_options)
-
-        job_name = get_workflow_name(self.config)
-        if scheduler_options is None:
-            scheduler_options = ""
-        else:
-            scheduler_options += "\n"
-        scheduler_options += f"#SBATCH --job-name={job_name}\n"
-        if qos:
-            scheduler_options += f"#SBATCH --qos={qos}\n"
-        if constraint:
-            scheduler_options += f"#SBATCH --constraint={constraint}\n"
-        if singleton:
-            # The following SBATCH directives allow only a single slurm job
-            # (parsl block) with our job_name to run at once. This means we can
-            # have one job running, and one already in the queue when the first
-            # exceeds the walltime limit. More backups could be achieved with a
-            # larger value of max_blocks. This only allows one job to be
-            # actively running at once, so that needs to be sized appropriately
-            # by the user.
-            scheduler_options += "#SBATCH --dependency=singleton\n"
+        prefetch_capacity = get_bps_config_value(self.site, "prefetch_capacity", int)
+
+        # The job-name/qos/constraint/singleton directives are identical for
+        # every executor built from the same inputs (e.g., TripleSlurm's
+        # three tiers), so render that block once per distinct combination
+        # and cache it on the instance.
+        preamble_cache: dict[tuple, str] = self.__dict__.setdefault("_preamble_cache", {})
+        key = (qos, constraint, singleton)
+        preamble = preamble_cache.get(key)
+        if preamble is None:
+            # Accumulate the directives in a list and join once, rather than
+            # growing a string with repeated concatenation.
+            parts = [f"#SBATCH --job-name={self._job_name}"]
+            if qos:
+                parts.append(f"#SBATCH --qos={qos}")
+            if constraint:
+                parts.append(f"#SBATCH --constraint={constraint}")
+            if singleton:
+                # The following SBATCH directives allow only a single slurm
+                # job (parsl block) with our job_name to run at once. This
+                # means we can have one job running, and one already in the
+                # queue when the first exceeds the walltime limit. More
+                # backups could be achieved with a larger value of
+                # max_blocks. This only allows one job to be actively running
+                # at once, so that needs to be sized appropriately by the
+                # user.
+                parts.append("#SBATCH --dependency=singleton")
+            preamble = preamble_cache[key] = "\n".join(parts) + "\n"
+        scheduler_options = (scheduler_options + "\n" if scheduler_options else "") + preamble
+        executor_kwargs = dict(executor_options) if executor_options else {}
+        if prefetch_capacity is not None:
+            # Explicit executor_options take precedence over the config knob.
+            executor_kwargs.setdefault("prefetch_capacity", prefetch_capacity)
         return HighThroughputExecutor(
             label,
             provider=SlurmProvider(
@@ -167,8 +195,8 @@ class Slurm(SiteConfig):
                 **(provider_options or {}),
             ),
             mem_per_worker=mem_per_worker,
-            address=self.get_address(),
-            **(executor_options or {}),
+            address=self._address,
+            **executor_kwargs,
         )
 
     def get_executors(self) -> list[ParslExecutor]:
@@ -242,6 +270,15 @@ class TripleSlurm(Slurm):
         self.small_walltime = get_bps_config_value(self.site, "small_walltime", str, "10:00:00")
         self.medium_walltime = get_bps_config_value(self.site, "medium_walltime", str, "10:00:00")
         self.large_walltime = get_bps_config_value(self.site, "large_walltime", str, "40:00:00")
+        # Dispatch table for select_executor: memory thresholds (GB) with the
+        # label to return for each (and "large" beyond the last). The
+        # thresholds are user-overridable, so sort the (threshold, label)
+        # pairs together — bisect is only correct on an ascending sequence;
+        # the tier index breaks ties in favour of the earlier tier, matching
+        # a first-match scan.
+        tier_table = sorted(((self.small_memory, 0, "small"), (self.medium_memory, 1, "medium")))
+        self._memory_thresholds = tuple(threshold for threshold, _, _ in tier_table)
+        self._memory_labels = (*(label for _, _, label in tier_table), "large")
 
     def get_executors(
         self,
@@ -266,26 +303,20 @@ class TripleSlurm(Slurm):
         **common_options
             Common options for ``make_executor`` for each of the executors.
         """
-        if small_options is None:
-            small_options = {}
-        if medium_options is None:
-            medium_options = {}
-        if large_options is None:
-            large_options = {}
-
-        small_options["walltime"] = small_options.get("walltime", self.small_walltime)
-        medium_options["walltime"] = medium_options.get("walltime", self.medium_walltime)
-        large_options["walltime"] = large_options.get("walltime", self.large_walltime)
-
-        small_options["mem_per_worker"] = small_options.get("mem_per_worker", self.small_memory)
-        medium_options["mem_per_worker"] = medium_options.get("mem_per_worker", self.medium_memory)
-        large_options["mem_per_worker"] = large_options.get("mem_per_worker", self.large_memory)
-
-        return [
-            self.make_executor("small", **small_options, **(common_options or {})),
-            self.make_executor("medium", **medium_options, **(common_options or {})),
-            self.make_executor("large", **large_options, **(common_options or {})),
-        ]
+        tiers = (
+            ("small", small_options, self.small_walltime, self.small_memory),
+            ("medium", medium_options, self.medium_walltime, self.medium_memory),
+            ("large", large_options, self.large_walltime, self.large_memory),
+        )
+        executors = []
+        for label, options, walltime, memory in tiers:
+            if options is None:
+                options = {}
+            # setdefault does a single lookup where get-then-set needs two.
+            options.setdefault("walltime", walltime)
+            options.setdefault("mem_per_worker", memory)
+            executors.append(self.make_executor(label, **options, **common_options))
+        return executors
 
     def select_executor(self, job: "ParslJob") -> str:
         """Get the ``label`` of the executor to use to execute a job.
@@ -302,9 +333,8 @@ class TripleSlurm(Slurm):
         label : `str`
             Label of executor to use to execute ``job``.
         """
-        memory = job.generic.request_memory / 1024  # GB
-        if memory <= self.small_memory:
-            return "small"
-        if memory <= self.medium_memory:
-            return "medium"
-        return "large"
+        # bisect_left finds the smallest tier whose memory limit accommodates
+        # the request; this runs once per job, so stay out of Python-level
+        # comparison chains.
+        memory = job.generic.request_memory * _MB_TO_GB  # GB
+        return self._memory_labels[bisect_left(self._memory_thresholds, memory)]
@@ -27,20 +27,13 @@
 
 from typing import TYPE_CHECKING, Any
 
-from parsl.executors import WorkQueueExecutor
-from parsl.executors.base import ParslExecutor
-from parsl.launchers import SrunLauncher
-from parsl.providers import LocalProvider
-
-try:
-    from parsl.providers.base import ExecutionProvider
-except ImportError:
-    from parsl.providers.provider_base import ExecutionProvider  # type: ignore
-
-from ..configuration import get_bps_config_value
+from ..configuration import get_bps_config_value, get_bps_config_values
 from ..site import SiteConfig
 
 if TYPE_CHECKING:
+    from parsl.executors.base import ParslExecutor
+    from parsl.providers.base import ExecutionProvider
+
     from ..job import ParslJob
 
 __all__ = ("WorkQueue", "LocalSrunWorkQueue")
@@ -85,12 +78,12 @@ class WorkQueue(SiteConfig):
     def make_executor(
         self,
         label: str,
-        provider: ExecutionProvider,
+        provider: "ExecutionProvider",
         *,
         port: int = 9000,
         worker_options: str = "",
         wq_max_retries: int = 1,
-    ) -> ParslExecutor:
+    ) -> "ParslExecutor":
         """Return a `WorkQueueExecutor`.  The ``provider`` contains the
         site-specific configuration.
 
@@ -110,15 +103,24 @@ class WorkQueue(SiteConfig):
             ``None`` to have it try indefinitely; set to ``1`` to have Parsl
             control the number of retries.  Default: ``1``.
         """
-        port = get_bps_config_value(self.site, "port", int, port)
-        worker_options = get_bps_config_value(self.site, "worker_options", str, worker_options)
-        max_retries = get_bps_config_value(self.site, "wq_max_retries", int, wq_max_retries)
+        # Deferred import: pulling in the work_queue executor machinery is
+        # only needed when an executor is actually built.
+        from parsl.executors import WorkQueueExecutor
+
+        values = get_bps_config_values(
+            self.site,
+            {
+                "port": (int, port),
+                "worker_options": (str, worker_options),
+                "wq_max_retries": (int, wq_max_retries),
+            },
+        )
         return WorkQueueExecutor(
             label=label,
             provider=provider,
-            port=port,
-            worker_options=worker_options,
-            max_retries=max_retries,
+            port=values["port"],
+            worker_options=values["worker_options"],
+            max_retries=values["wq_max_retries"],
             shared_fs=True,
             autolabel=False,
         )
@@ -149,8 +151,18 @@ class LocalSrunWorkQueue(WorkQueue):
       Default: ``1``.
     """
 
-    def get_executors(self) -> list[ParslExecutor]:
-        """Get a list of executors to be used in processing."""
+    def get_executors(self) -> list["ParslExecutor"]:
+        """Get a list of executors to be used in processing.
+
+        The executor list is built once per instance and cached: repeated
+        calls return the same objects rather than constructing fresh ones.
+        """
+        executors: list[ParslExecutor] | None = getattr(self, "_executors", None)
+        if executors is not None:
+            return executors
+        from parsl.launchers import SrunLauncher
+        from parsl.providers import LocalProvider
+
         nodes_per_block = get_bps_config_value(self.site, "nodes_per_block", int, 1)
         provider_options: dict[str, Any] = {
             "nodes_per_block": nodes_per_block,
@@ -163,7 +175,9 @@ class LocalSrunWorkQueue(WorkQueue):
         if nodes_per_block > 1:
             provider_options["launcher"] = SrunLauncher(overrides="-K0 -k --slurmd-debug=verbose")
         provider = LocalProvider(**provider_options)
-        return [self.make_executor("work_queue", provider)]
+        executors = [self.make_executor("work_queue", provider)]
+        self._executors = executors
+        return executors
 
     def select_executor(self, job: "ParslJob") -> str:
         """Get the ``label`` of the executor to use to execute a job.
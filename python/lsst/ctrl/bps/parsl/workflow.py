@@ -29,24 +29,37 @@ import logging
 import os
 import pickle
 from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, wait
+from functools import partial
+from typing import TYPE_CHECKING
 
-import parsl
-import parsl.config
 from lsst.ctrl.bps import BaseWmsWorkflow, BpsConfig, GenericWorkflow, GenericWorkflowJob
-from parsl.app.app import bash_app
-from parsl.app.bash import BashApp
-from parsl.app.futures import Future
 
 from .configuration import get_workflow_filename, set_parsl_logging
 from .job import ParslJob, get_file_paths
-from .site import SiteConfig
+
+if TYPE_CHECKING:
+    import parsl
+    import parsl.config
+    from parsl.app.bash import BashApp
+
+    from .site import SiteConfig
 
 __all__ = ("ParslWorkflow", "get_parsl_config")
 
 _log = logging.getLogger("lsst.ctrl.bps.parsl")
 
+# Keyword arguments excluded from parsl's app cache key; one shared constant
+# rather than a fresh list per executor (parsl accepts any sequence and takes
+# its own copy per task).
+_IGNORE_FOR_CACHE = ("stderr", "stdout")
+
+# Jobs run locally by initialize_jobs/finalize_jobs rather than submitted to
+# parsl; checked once per job during the submission walk.
+_LOCAL_ONLY = frozenset({"pipetaskInit", "mergeExecutionButler"})
 
-def get_parsl_config(config: BpsConfig) -> parsl.config.Config:
+
+def get_parsl_config(config: BpsConfig, site: "SiteConfig | None" = None) -> "parsl.config.Config":
     """Construct parsl configuration from BPS configuration.
 
     For details on the site configuration, see `SiteConfig`. For details on the
@@ -61,13 +74,20 @@ def get_parsl_config(config: BpsConfig) -> parsl.config.Config:
     ----------
     config : `BpsConfig`
         BPS configuration.
+    site : `SiteConfig`, optional
+        Site configuration; constructed from ``config`` if not provided.
+        Callers that already hold a site configuration should pass it in to
+        avoid resolving the site class and sub-configuration a second time.
 
     Returns
     -------
     parsl_config : `parsl.config.Config`
         Parsl configuration.
     """
-    site = SiteConfig.from_config(config)
+    if site is None:
+        from .site import SiteConfig
+
+        site = SiteConfig.from_config(config)
     return site.get_parsl_config()
 
 
@@ -110,34 +130,119 @@ class ParslWorkflow(BaseWmsWorkflow):
 
         self.path = path
         self.bps_config = config
-        self.parsl_config = get_parsl_config(config)
-        self.site = SiteConfig.from_config(config)
         self.dfk: parsl.DataFlowKernel | None = None  # type: ignore
-        self.command_prefix = self.site.get_command_prefix()
-
-        # these are function decorators
-        self.apps: dict[str, BashApp] = {
-            ex.label: bash_app(  # type: ignore
-                executors=[ex.label], cache=True, ignore_for_cache=["stderr", "stdout"]
-            )
-            for ex in self.parsl_config.executors
-        }
 
         self.jobs = jobs
         self.parents = parents
-        self.endpoints = endpoints
+        # Materialize once: 'endpoints' may be a generator, and run() and
+        # pickling both need a stable, compact sequence.
+        self.endpoints = tuple(endpoints)
         self.final = final
 
-    def __reduce__(self):
-        """Recipe for pickle"""
-        return type(self), (
-            self.name,
-            self.bps_config,
-            self.path,
-            self.jobs,
-            self.parents,
-            self.endpoints,
-            self.final,
+        # Futures already obtained by 'execute', so that shared ancestors are
+        # resolved once per workflow rather than once per endpoint.
+        self._future_cache: dict[str, Future | None] = {}
+
+        # Runtime state (site configuration, parsl configuration and app
+        # decorators) is built lazily on first use, so that constructing or
+        # unpickling a workflow just to inspect it doesn't re-parse the
+        # configuration or import the site class.
+        self._site: SiteConfig | None = None
+        self._parsl_config: parsl.config.Config | None = None
+        self._apps: dict[str, BashApp] | None = None
+        self._submit: dict[str, partial] | None = None
+        # Submission callable shared by every job when there is a single
+        # executor; set alongside the per-label callables.
+        self._only_submit: partial | None = None
+        self._command_prefix: str | None = None
+
+    @property
+    def site(self) -> "SiteConfig":
+        """Site configuration, constructed on first use (`SiteConfig`)."""
+        if self._site is None:
+            from .site import SiteConfig
+
+            self._site = SiteConfig.from_config(self.bps_config)
+        return self._site
+
+    @property
+    def parsl_config(self) -> "parsl.config.Config":
+        """Parsl configuration, constructed on first use
+        (`parsl.config.Config`).
+        """
+        if self._parsl_config is None:
+            self._parsl_config = get_parsl_config(self.bps_config, self.site)
+        return self._parsl_config
+
+    @property
+    def command_prefix(self) -> str:
+        """Bash commands prepended to every job command (`str`)."""
+        if self._command_prefix is None:
+            self._command_prefix = self.site.get_command_prefix()
+        return self._command_prefix
+
+    @property
+    def apps(self) -> "dict[str, BashApp]":
+        """Parsl bash_app decorator for each executor label (`dict`)."""
+        if self._apps is None:
+            from parsl.app.app import bash_app
+
+            self._apps = {
+                ex.label: bash_app(  # type: ignore
+                    executors=[ex.label], cache=True, ignore_for_cache=_IGNORE_FOR_CACHE
+                )
+                for ex in self.parsl_config.executors
+            }
+        return self._apps
+
+    @property
+    def _submitters(self) -> dict[str, partial]:
+        """Per-executor submission callables (`dict`).
+
+        The app, command prefix and resource flag are invariant over the
+        workflow, so they are bound once per executor here rather than passed
+        through ``get_future`` on every submission.
+        """
+        if self._submit is None:
+            command_prefix = self.command_prefix
+            add_resources = self.site.add_resources
+            self._submit = {
+                label: partial(
+                    ParslJob.get_future, app=app, command_prefix=command_prefix, add_resources=add_resources
+                )
+                for label, app in self.apps.items()
+            }
+            if len(self._submit) == 1:
+                self._only_submit = next(iter(self._submit.values()))
+        return self._submit
+
+    def __getstate__(self):
+        """Return picklable state.
+
+        Runtime objects (site configuration, parsl configuration, apps and
+        any futures) are dropped; they are rebuilt on demand after unpickling
+        rather than eagerly during ``read``.
+        """
+        return {
+            "name": self.name,
+            "bps_config": self.bps_config,
+            "path": self.path,
+            "jobs": self.jobs,
+            "parents": self.parents,
+            "endpoints": self.endpoints,
+            "final": self.final,
+        }
+
+    def __setstate__(self, state):
+        """Restore from pickled state."""
+        self.__init__(  # type: ignore[misc]
+            state["name"],
+            state["bps_config"],
+            state["path"],
+            state["jobs"],
+            state["parents"],
+            state["endpoints"],
+            state["final"],
         )
 
     @classmethod
@@ -164,13 +269,27 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         # Generate list of jobs
         jobs: dict[str, ParslJob] = {}
+        # Jobs in the same cluster usually have identical input mappings
+        # (e.g., just the butler config); sharing one dict object between
+        # them cuts memory and shrinks the pickled workflow.
+        shared_paths: dict[tuple[tuple[str, str], ...], dict[str, str]] = {}
         for job_name in generic_workflow:
             generic_job = generic_workflow.get_job(job_name)
             assert generic_job.name not in jobs
-            jobs[job_name] = ParslJob(generic_job, config, get_file_paths(generic_workflow, job_name))
-
-        parents = {name: set(generic_workflow.predecessors(name)) for name in jobs}
-        endpoints = [name for name in jobs if generic_workflow.out_degree(name) == 0]
+            file_paths = get_file_paths(generic_workflow, job_name)
+            file_paths = shared_paths.setdefault(tuple(sorted(file_paths.items())), file_paths)
+            jobs[job_name] = ParslJob(generic_job, config, file_paths)
+
+        # Read the graph's adjacency mappings directly: two attribute lookups
+        # for the whole workflow rather than a predecessors/out_degree method
+        # call per job.
+        pred = generic_workflow.pred
+        succ = generic_workflow.succ
+        # Tuples rather than sets: we only ever iterate the predecessors, and
+        # a tuple is much smaller in memory and on disk for large workflows;
+        # sorting keeps the submission order deterministic.
+        parents = {name: tuple(sorted(pred[name])) for name in jobs}
+        endpoints = [name for name in jobs if not succ[name]]
 
         # Add final job: execution butler merge
         job = generic_workflow.get_final()
@@ -179,6 +298,10 @@ class ParslWorkflow(BaseWmsWorkflow):
             assert isinstance(job, GenericWorkflowJob)
             final = ParslJob(job, config, get_file_paths(generic_workflow, job.name))
 
+        # Create all log directories up front: one makedirs per unique
+        # directory here instead of one per job at execution time.
+        ParslJob.pre_create_log_dirs(jobs.values() if final is None else [*jobs.values(), final])
+
         return cls(generic_workflow.name, config, out_prefix, jobs, parents, endpoints, final)
 
     def write(self, out_prefix: str):
@@ -196,7 +319,9 @@ class ParslWorkflow(BaseWmsWorkflow):
         filename = get_workflow_filename(out_prefix)
         _log.info("Writing workflow with ID=%s", out_prefix)
         with open(filename, "wb") as fd:
-            pickle.dump(self, fd)
+            # The highest protocol supports out-of-band buffers and framing,
+            # which makes a noticeable difference for many-job workflows.
+            pickle.dump(self, fd, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def read(cls, out_prefix: str) -> "ParslWorkflow":
@@ -215,6 +340,11 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         filename = get_workflow_filename(out_prefix)
         with open(filename, "rb") as fd:
+            if hasattr(os, "posix_fadvise"):
+                # Checkpoints are read front-to-back in one pass; telling the
+                # kernel lets it read ahead aggressively, which matters for
+                # large workflows on networked filesystems.
+                os.posix_fadvise(fd.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
             self = pickle.load(fd)
         assert isinstance(self, cls)
         return self
@@ -237,14 +367,11 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         futures = [self.execute(name) for name in self.endpoints]
         if block:
-            # Calling .exception() for each future blocks returning
-            # from this method until all the jobs have executed or
-            # raised an error.  This is needed for running in a
-            # non-interactive python process that would otherwise end
-            # before the futures resolve.
-            for ff in futures:
-                if ff is not None:
-                    ff.exception()
+            # Block returning from this method until all the jobs have
+            # executed or raised an error, whatever order they resolve in.
+            # This is needed for running in a non-interactive python process
+            # that would otherwise end before the futures resolve.
+            wait([ff for ff in futures if ff is not None])
             self.shutdown()
             self.finalize_jobs()
         return futures
@@ -252,6 +379,12 @@ class ParslWorkflow(BaseWmsWorkflow):
     def execute(self, name: str) -> Future | None:
         """Execute a job.
 
+        The job's ancestors are submitted first (each at most once; the
+        `ParslJob` caches its `Future`), walking the dependency graph with an
+        explicit stack rather than recursion so that deep workflows don't hit
+        the python recursion limit and shared ancestors aren't re-traversed
+        once per path.
+
         Parameters
         ----------
         name : `str`
@@ -263,22 +396,34 @@ class ParslWorkflow(BaseWmsWorkflow):
             A `Future` object linked to the execution of the job, or `None` if
             the job is being reserved to run locally.
         """
-        if name in ("pipetaskInit", "mergeExecutionButler"):
-            # These get done outside of parsl
-            return None
-        job = self.jobs[name]
-        inputs = [self.execute(parent) for parent in self.parents[name]]
-        executors = self.parsl_config.executors
-        if len(executors) > 1:
-            label = self.site.select_executor(job)
-        else:
-            label = executors[0].label
-        return job.get_future(
-            self.apps[label],
-            [ff for ff in inputs if ff is not None],
-            self.command_prefix,
-            self.site.add_resources,
-        )
+        futures = self._future_cache
+        if name in futures:
+            return futures[name]
+        stack = [name]
+        while stack:
+            current = stack[-1]
+            if current in futures:
+                stack.pop()
+                continue
+            if current in _LOCAL_ONLY:
+                # These get done outside of parsl
+                futures[current] = None
+                stack.pop()
+                continue
+            pending = [parent for parent in self.parents[current] if parent not in futures]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            job = self.jobs[current]
+            inputs = [ff for parent in self.parents[current] if (ff := futures[parent]) is not None]
+            submit = self._submitters  # accessed first: building these resolves the fast path
+            if (only := self._only_submit) is not None:
+                # Single-executor fast path: no label selection or lookup.
+                futures[current] = only(job, inputs=inputs)
+            else:
+                futures[current] = submit[self.site.select_executor(job)](job, inputs=inputs)
+        return futures[name]
 
     def load_dfk(self):
         """Load data frame kernel.
@@ -287,6 +432,8 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         if self.dfk is not None:
             raise RuntimeError("Workflow has already started.")
+        import parsl
+
         set_parsl_logging(self.bps_config)
         self.dfk = parsl.load(self.parsl_config)
 
@@ -297,6 +444,8 @@ class ParslWorkflow(BaseWmsWorkflow):
 
     def restart(self):
         """Restart the workflow after interruption."""
+        import parsl.utils
+
         self.parsl_config.checkpoint_files = parsl.utils.get_last_checkpoint()
         self.load_dfk()
 
@@ -307,6 +456,8 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         if self.dfk is None:
             raise RuntimeError("Workflow not started.")
+        import parsl
+
         self.dfk.cleanup()
         self.dfk = None
         parsl.DataFlowKernelLoader.clear()
@@ -321,7 +472,9 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         job = self.jobs.get("pipetaskInit", None)
         if job is not None:
-            os.makedirs(os.path.join(self.path, "logs"))
+            # The log directories are normally pre-created at workflow
+            # construction, so tolerate an existing directory here.
+            os.makedirs(os.path.join(self.path, "logs"), exist_ok=True)
             job.run_local()
 
     def finalize_jobs(self):
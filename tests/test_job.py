@@ -82,3 +82,19 @@ def testInitWithoutTemplate():
     parsl_job = ParslJob(gwjob, config, {})
     assert parsl_job.stdout == os.path.join(submit_path, "logs/job3.stdout")
     assert parsl_job.stderr == os.path.join(submit_path, "logs/job3.stderr")
+
+
+def testEvaluateCommandLine():
+    """Test symbolic-name resolution, including nested symbolic names.
+
+    An actual value for a filename may contain a symbolic name for an
+    environment variable, which must be resolved too.
+    """
+    submit_path = os.path.join(TESTDIR, "evaluate_command_line")
+    config = BpsConfig({"subDirTemplate": "", "submitPath": submit_path}, search_order=[])
+    gwjob = GenericWorkflowJob("job4", label="label4")
+    gwjob.tags = {}
+
+    parsl_job = ParslJob(gwjob, config, {"other": "/data/<ENV:HOME>/file.txt"})
+    command = parsl_job.evaluate_command_line("run <FILE:other> --x <ENV:USER>")
+    assert command == "run /data/${HOME}/file.txt --x ${USER}"
@@ -0,0 +1,51 @@
+# This file is part of ctrl_bps_parsl.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org) and the LSST DESC (https://www.lsstdesc.org/).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This software is dual licensed under the GNU General Public License and also
+# under a 3-clause BSD license. Recipients may choose which of these licenses
+# to use; please see the files gpl-3.0.txt and/or bsd_license.txt,
+# respectively.  If you choose the GPL option then the following text applies
+# (but note that there is still no warranty even if you opt for BSD instead):
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import patch
+
+from lsst.ctrl.bps.parsl.sites.princeton import Tiger
+
+
+def testTigerGetAddress():
+    """Test that Tiger.get_address caches without recursing.
+
+    Tiger.get_address must not cache under the name of the base class's
+    ``_address`` cached property, which itself calls ``get_address``: reading
+    it from an instance that hasn't resolved the address yet would recurse
+    forever.
+    """
+    site = object.__new__(Tiger)  # address resolution needs no configuration
+    with (
+        patch("lsst.ctrl.bps.parsl.sites.princeton.net_if_addrs", return_value={"ib0": []}),
+        patch("lsst.ctrl.bps.parsl.sites.princeton.address_by_interface", return_value="10.0.0.1") as resolve,
+    ):
+        assert site.get_address() == "10.0.0.1"
+        assert site.get_address() == "10.0.0.1"
+        resolve.assert_called_once()
+    # The base class's cached property goes through get_address and must see
+    # the cached value too.
+    assert site._address == "10.0.0.1"